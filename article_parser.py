@@ -0,0 +1,59 @@
+import multiprocessing
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+import trafilatura
+from newspaper import Article
+
+_start_lock = threading.Lock()
+
+
+# Kept apart from the Streamlit script so parse worker processes only import this.
+def parse_html(url, html):
+    text = trafilatura.extract(
+        html,
+        include_comments=False,
+        include_tables=False,
+        favor_precision=True
+    )
+    if not text:
+        # Reuse the page we already fetched instead of letting newspaper download it again.
+        article = Article(url)
+        article.set_html(html)
+        article.parse()
+        text = article.text
+    return text
+
+
+def _ready():
+    return None
+
+
+def start_parse_pool(max_workers):
+    """Return a spawn-context pool whose workers are all started from this module."""
+    pool = ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context("spawn")
+    )
+    this = sys.modules[__name__]
+    with _start_lock:
+        # Streamlit installs the app script as __main__, and spawn re-runs __main__
+        # in every new worker. Point it here while the workers start. Spawn pools
+        # start a worker per submit until full, and no result can come back before
+        # the loop ends, so all workers start here and later submits never spawn.
+        main = sys.modules["__main__"]
+        sys.modules["__main__"] = this
+        try:
+            for _ in range(max_workers):
+                pool.submit(_ready)
+        finally:
+            # Only restore if no script rerun replaced __main__ in the meantime.
+            raced = sys.modules["__main__"] is not this
+            if not raced:
+                sys.modules["__main__"] = main
+    if raced:
+        # A rerun swapped __main__ mid-start, so a worker may have loaded the app script.
+        pool.shutdown(wait=False, cancel_futures=True)
+        raise RuntimeError("parse pool start-up overlapped a script rerun")
+    return pool
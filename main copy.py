@@ -1,8 +1,19 @@
 import os
+import re
+import hashlib
+import threading
+from collections import Counter
+from html import escape
+import diskcache
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime, timedelta
 from dotenv import load_dotenv
-from newspaper import Article
+from article_parser import parse_html, start_parse_pool
+import tiktoken
 from groq import Groq
 import streamlit as st
 
@@ -15,11 +26,244 @@ if not NEWS_API_KEY or not GROQ_API_KEY:
     st.error("❌ Please set NEWS_API_KEY and GROQ_API_KEY in the .env file.")
     st.stop()
 
-client = Groq(api_key=GROQ_API_KEY)
+
+# No spinner: it would emit a Streamlit element before st.set_page_config runs.
+@st.cache_resource(show_spinner=False)
+def get_groq():
+    # One client per server process, shared across reruns and sessions.
+    return Groq(api_key=GROQ_API_KEY)
+
+
+client = get_groq()
 MODEL = "llama-3.1-8b-instant"
+MAX_WORKERS = 8
+PROCESS_POOL_MIN_PAGES = 6
+MIN_DESCRIPTION_CHARS = 300
+DUPLICATE_THRESHOLD = 0.8
+NO_ARTICLES_MESSAGE = "No recent articles found for this topic."
+MAX_ARTICLE_TOKENS = 600
+_SENTENCE_RE = re.compile(r"(?<=[.!?])\s+")
+_BATCH_RE = re.compile(r"^###\s*ARTICLE\s*(\d+)\s*:\s*(.+?)(?=^###|\Z)", re.M | re.S)
+
+_encoding = tiktoken.get_encoding("cl100k_base")
+
+
+@st.cache_resource(show_spinner=False)
+def get_cache():
+    # Opened once per server process; a new Cache per rerun would leak SQLite handles.
+    return diskcache.Cache(".rapidreads_cache")
+
+
+cache = get_cache()
+ARTICLE_CACHE_TTL = 86400 * 7
+REPORT_CACHE_TTL = 3600
+
+
+@st.cache_resource(show_spinner=False)
+def get_session():
+    # Shared across reruns so repeated requests reuse pooled keep-alive connections.
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=16,
+        max_retries=Retry(total=2, backoff_factor=0.3)
+    ))
+    return session
+
+
+_session = get_session()
+
+# ---------------- Prompts ----------------
+# Instructions live in fixed system messages that come first in every request,
+# so Groq can reuse the cached prefix and only the article text varies.
+SUMMARIZER_SYSTEM = """You are the summarization engine behind RapidReads, a news digest app.
+You receive the extracted body text of one or more news articles and write short,
+factual summaries that a busy reader can skim in a few seconds.
+
+Style guide:
+- Write 3-5 concise sentences per article, in plain prose. No bullet points, no headings
+  inside a summary, no markdown emphasis.
+- Lead with the single most important development: who did what, and when if known.
+- Follow with the most relevant supporting facts: figures, locations, named organisations,
+  direct consequences and what happens next.
+- Keep numbers, dates, currencies and units exactly as they appear in the source.
+- Stay neutral. Do not add opinions, predictions or background that the article does not
+  contain, and do not speculate about motives.
+- Attribute claims to their source when the article does ("the company said",
+  "according to police").
+- Ignore boilerplate that survives extraction: cookie notices, newsletter prompts,
+  "read more" links, photo captions, author bios, related-story lists and ads.
+- If the text is mostly boilerplate, paywall notices or an error message, reply with
+  exactly: Unable to summarize: Insufficient content.
+- Never mention that you are summarizing, and never start with phrases like
+  "This article" or "The article discusses".
+- Write in English, using the past tense for completed events and the present tense for
+  ongoing situations.
+
+Example 1
+Article: The city council voted 7-2 on Tuesday to approve a $48 million plan to replace
+the aging Riverside water treatment plant. Officials said the existing facility, built in
+1962, has failed state inspections twice in the past three years. Construction is
+expected to begin next spring and take roughly two years. Residents will see an average
+increase of $6 per month on water bills starting in January to help fund the project.
+Council member Dana Ortiz, who voted against the plan, said the city should have sought
+more federal funding before raising rates. Subscribe to our newsletter for more local news.
+Summary: The city council approved a $48 million plan on Tuesday, by a 7-2 vote, to
+replace the Riverside water treatment plant. The 1962 facility has failed state
+inspections twice in three years. Construction is set to start next spring and last
+about two years. Water bills will rise by an average of $6 a month from January to help
+pay for it, a move council member Dana Ortiz opposed, arguing the city should have
+pursued more federal funding first.
+
+Example 2
+Article: Shares of Norvale Robotics fell 14% in after-hours trading after the company
+cut its full-year revenue forecast to $1.2 billion from $1.5 billion. Chief executive
+Priya Raman blamed delayed orders from two large logistics customers and higher
+component costs. The company also announced it would pause hiring for the rest of the
+year. Analysts at Halden Securities downgraded the stock to "hold", citing uncertainty
+about demand in Europe. Norvale will report full quarterly results on March 3.
+Summary: Norvale Robotics cut its full-year revenue forecast to $1.2 billion from $1.5
+billion, sending its shares down 14% in after-hours trading. Chief executive Priya
+Raman attributed the cut to delayed orders from two large logistics customers and
+rising component costs. The company is pausing hiring for the rest of the year, and
+Halden Securities downgraded the stock to "hold" over uncertain European demand. Full
+quarterly results are due on March 3.
+
+Example 3
+Article: Researchers at the University of Tessaly have developed a battery electrode
+made from recycled aluminium that retained 92% of its capacity after 1,000 charge
+cycles in laboratory tests. The team said the material costs roughly a third as much
+as conventional graphite electrodes. The findings were published in the journal Energy
+Materials. Lead author Marco Vell cautioned that the cells have only been tested at
+small scale and that commercial use is at least five years away. Photo: the research
+team in their lab.
+Summary: University of Tessaly researchers built a battery electrode from recycled
+aluminium that kept 92% of its capacity after 1,000 charge cycles in lab tests. The
+team said the material costs about a third as much as conventional graphite
+electrodes. The results were published in Energy Materials. Lead author Marco Vell
+noted the cells have only been tested at small scale and said commercial use is at
+least five years away.
+
+When you receive several articles at once, each one is introduced by a header line of
+the form "### ARTICLE <n>:". Answer with one section per article, in the same order,
+each starting with its original header line followed by the summary on the next line.
+Do not merge articles, skip articles or add any text outside those sections."""
+
+REPORT_SYSTEM = """You are the report writer behind RapidReads, a news digest app.
+You receive a numbered list of article titles, summaries and links about one topic, and
+write a cohesive report of 200-300 words that highlights the key insights and patterns
+across them.
+
+Guidelines:
+- Open with one or two sentences that state the overall picture.
+- Group related developments together instead of walking through the articles one by one.
+- Point out agreements, contradictions and trends between sources where they exist.
+- Only use facts present in the summaries; do not invent details, figures or quotes.
+- Keep numbers, dates and names exactly as they appear in the summaries.
+- Keep a neutral, informative tone and write in flowing paragraphs.
+- You may use short markdown headings or bold text sparingly for structure.
+- Do not repeat the article titles as a list, and do not include the links; the app shows
+  every article separately below the report.
+- Skip any entry whose summary reads "Unable to summarize: Insufficient content." and do
+  not mention that it was skipped.
+- If the summaries cover unrelated stories, say so briefly and give each its own short
+  paragraph rather than forcing a common theme.
+- If only one usable summary remains, write a shorter report about that story alone.
+- End with one sentence on what to watch next, but only if the summaries mention upcoming
+  events, deadlines or decisions.
+- Never refer to "the articles", "the summaries" or "the sources provided"; write as if
+  briefing the reader directly on the topic.
+- When two summaries give different figures for the same thing, report both and attribute
+  each one ("one report puts the cost at $2 billion, another at $2.4 billion") instead of
+  picking one or averaging them.
+- Prefer concrete facts over general statements: a figure, a date or a named organisation
+  is more useful to the reader than a phrase like "significant developments".
+- Stay within the word limit. If there is more material than fits, keep the developments
+  that appear in several summaries and drop minor details that appear only once.
+- Write in English, using the past tense for completed events and the present tense for
+  ongoing situations.
+
+Example
+Input:
+### 1. Grid operator warns of tight winter supply
+- **Summary:** The national grid operator said reserve margins this winter could fall to
+4%, the lowest in a decade, because two nuclear units remain offline for repairs. It urged
+large industrial users to sign up for paid demand-reduction schemes. The operator expects
+to publish a final outlook on October 30.
+- [Read full article](https://example.com/grid-winter)
+
+### 2. Offshore wind farm begins delivering power ahead of schedule
+- **Summary:** The 1.2-gigawatt North Bank offshore wind farm started sending power to the
+grid three months early, its developer said. Full output is expected by December. The
+project's operators said the early start could help ease pressure on winter supply.
+- [Read full article](https://example.com/north-bank)
+
+### 3. Households face higher bills as regulator lifts price cap
+- **Summary:** The energy regulator raised the household price cap by 9% from October 1,
+citing higher wholesale gas prices. The typical annual bill will rise to about $1,900.
+Consumer groups called for more targeted support for low-income households.
+- [Read full article](https://example.com/price-cap)
+
+### 4. Battery storage approvals hit record
+- **Summary:** Planning approvals for grid-scale battery projects reached a record 6
+gigawatts in the first half of the year, according to an industry group. Developers said
+faster grid connections remain the main bottleneck.
+- [Read full article](https://example.com/battery-approvals)
+
+Report:
+The country heads into winter with a tight but improving electricity picture, as
+constrained supply and rising household costs sit alongside fast growth in new capacity.
+
+**Supply pressure.** The grid operator warned that reserve margins could drop to 4% this
+winter, the lowest in a decade, with two nuclear units still offline for repairs. It is
+asking large industrial users to join paid demand-reduction schemes to keep the system
+balanced.
+
+**New capacity arriving.** Relief is coming from renewables and storage. The 1.2-gigawatt
+North Bank offshore wind farm began delivering power three months ahead of schedule and is
+due to reach full output by December, which its operators said could ease winter
+pressure. Battery storage is also accelerating: planning approvals reached a record 6
+gigawatts in the first half of the year, although developers say slow grid connections
+are holding projects back.
+
+**Costs for households.** Consumers are feeling the strain of higher wholesale gas prices.
+The regulator lifted the price cap by 9% from October 1, taking the typical annual bill to
+about $1,900, and consumer groups are pressing for more targeted help for low-income
+households.
+
+Taken together, the near-term risk is on the supply side this winter, while the longer-term
+trend points to more wind and storage capacity, provided grid connections can keep pace.
+The operator's final winter outlook, due on October 30, will show whether the early wind
+output and demand-reduction schemes are enough to widen the margin."""
+
+
+ARTICLE_CARD_TMPL = """
+<div class="article-card">
+    <h4 style="margin-bottom: 10px;">{i}. {title}</h4>
+    <p style="margin-bottom: 12px; font-size: 15px; line-height: 1.6;">
+        {summary}
+    </p>
+    <a href="{url}" target="_blank" class="read-btn">Read More 👉</a>
+</div>
+"""
 
 
 # ---------------- Utility Functions ----------------
+# Prompt token usage for the current pipeline run, shown in the UI.
+token_usage = Counter()
+_usage_lock = threading.Lock()
+
+
+def _record_usage(usage):
+    if usage is None:
+        return
+    details = getattr(usage, "prompt_tokens_details", None)
+    with _usage_lock:
+        token_usage["prompt"] += usage.prompt_tokens or 0
+        token_usage["cached"] += getattr(details, "cached_tokens", 0) or 0
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
 def fetch_recent_articles(query, num_articles=4, days_back=30):
     url = 'https://newsapi.org/v2/everything'
     from_date = (datetime.now() - timedelta(days=days_back)).strftime('%Y-%m-%d')
@@ -31,7 +275,7 @@ def fetch_recent_articles(query, num_articles=4, days_back=30):
         'pageSize': num_articles,
         'language': 'en'
     }
-    response = requests.get(url, params=params)
+    response = _session.get(url, params=params, timeout=10)
     response.raise_for_status()
     data = response.json()
 
@@ -47,61 +291,253 @@ def fetch_recent_articles(query, num_articles=4, days_back=30):
     return articles
 
 
-def extract_full_text(url):
-    try:
-        article = Article(url)
-        article.download()
-        article.parse()
-        return article.text
-    except Exception as e:
-        return f"Error extracting {url}: {e}"
+def _fetch_html(url):
+    response = _session.get(url, timeout=10)
+    response.raise_for_status()
+    # Raw bytes: requests assumes ISO-8859-1 for text/html without a charset,
+    # while trafilatura and newspaper detect the encoding themselves.
+    return response.content
+
+
+@st.cache_resource(show_spinner=False)
+def get_parse_pool():
+    # One fixed-size pool, so workers pay their start-up imports once, not on every batch.
+    return start_parse_pool(min(MAX_WORKERS, os.cpu_count() or 1))
+
+
+def extract_full_texts(urls):
+    """Return {url: text}, downloading in threads and parsing in processes.
+
+    URLs that fail or yield no text are left out, so callers can fall back.
+    """
+    texts = {}
+    pending = []
+    for url in dict.fromkeys(urls):
+        cached = cache.get(url)
+        if cached is None:
+            pending.append(url)
+        else:
+            texts[url] = cached
+    if not pending:
+        return texts
+
+    htmls = {}
+    with ThreadPoolExecutor(max_workers=min(len(pending), MAX_WORKERS)) as ex:
+        futures = {url: ex.submit(_fetch_html, url) for url in pending}
+        for url, future in futures.items():
+            try:
+                htmls[url] = future.result()
+            except Exception:
+                continue
+
+    # Parsing is CPU-bound, so it only pays to leave the GIL behind for larger batches.
+    jobs = {}
+    if len(htmls) >= PROCESS_POOL_MIN_PAGES:
+        try:
+            pool = get_parse_pool()
+            jobs = {url: pool.submit(parse_html, url, html) for url, html in htmls.items()}
+        except BrokenProcessPool:
+            get_parse_pool.clear()
+            jobs = {}
+        except Exception:
+            # A pool that can't start or take work shouldn't fail the run; parse inline.
+            jobs = {}
+    for url, html in htmls.items():
+        try:
+            try:
+                text = jobs[url].result() if url in jobs else parse_html(url, html)
+            except BrokenProcessPool:
+                get_parse_pool.clear()
+                jobs = {}
+                text = parse_html(url, html)
+        except Exception:
+            continue
+        if text:
+            cache.set(url, text, expire=ARTICLE_CACHE_TTL)
+            texts[url] = text
+    return texts
+
+
+def _shingles(text, size=3):
+    text = " ".join(text.lower().split())
+    return {text[i:i + size] for i in range(max(len(text) - size + 1, 1))}
+
+
+def dedupe_articles(articles, threshold=DUPLICATE_THRESHOLD):
+    """Drop articles whose title and description nearly match an earlier one."""
+    kept, seen = [], []
+    for art in articles:
+        shingles = _shingles(f"{art['title'] or ''} {art['description']}")
+        if any(len(shingles & prev) / len(shingles | prev) >= threshold for prev in seen):
+            continue
+        kept.append(art)
+        seen.append(shingles)
+    return kept
+
+
+def needs_full_text(art, deep_extract=False):
+    # NewsAPI descriptions are often long enough to summarize on their own,
+    # which saves a full page download and parse.
+    return deep_extract or len(art.get('description', '')) < MIN_DESCRIPTION_CHARS
+
+
+def compress_text(text, max_tokens=MAX_ARTICLE_TOKENS):
+    """Drop very short sentences, then truncate the text to max_tokens tokens."""
+    sentences = [sent for sent in _SENTENCE_RE.split(text.strip()) if len(sent.split()) >= 5]
+    if sentences:
+        text = " ".join(sentences)
+    return _encoding.decode(_encoding.encode(text)[:max_tokens])
 
 
 def summarize_article(text, max_tokens=150):
     if not text or len(text.strip()) < 50:
         return "Unable to summarize: Insufficient content."
 
-    prompt = f"Summarize the key points of this article in 3-5 concise sentences:\n\n{text[:2000]}"
+    # Key the cache on a short digest; the leading underscore keeps
+    # Streamlit from hashing the full text on every call.
+    digest = hashlib.sha1(text.encode()).hexdigest()[:16]
+    return _summarize_cached(digest, text, max_tokens)
+
+
+@st.cache_data(ttl=86400, show_spinner=False)
+def _summarize_cached(digest, _text, max_tokens):
     response = client.chat.completions.create(
         model=MODEL,
-        messages=[{"role": "user", "content": prompt}],
+        messages=[
+            {"role": "system", "content": SUMMARIZER_SYSTEM},
+            {"role": "user", "content": compress_text(_text)}
+        ],
         max_tokens=max_tokens,
         temperature=0.5
     )
+    _record_usage(response.usage)
     return response.choices[0].message.content.strip()
 
 
-def generate_report(articles, summaries):
-    report_content = ""
-    for i, (art, summary) in enumerate(zip(articles, summaries), 1):
-        report_content += f"### {i}. {art['title']}\n"
-        report_content += f"- **Summary:** {summary}\n"
-        report_content += f"- [Read full article]({art['url']})\n\n"
+def summarize_articles_batch(texts, max_tokens=150):
+    """Summarize all texts with a single Groq call, one summary per text."""
+    summaries = [None] * len(texts)
+    blocks = []
+    for i, text in enumerate(texts):
+        if not text or len(text.strip()) < 50:
+            summaries[i] = "Unable to summarize: Insufficient content."
+        else:
+            blocks.append(f"### ARTICLE {i + 1}:\n{compress_text(text)}")
+    if not blocks:
+        return summaries
 
-    prompt = f"""Create a cohesive report (200–300 words) summarizing the key insights and patterns 
-    from these article summaries:\n\n{report_content}"""
+    response = client.chat.completions.create(
+        model=MODEL,
+        messages=[
+            {"role": "system", "content": SUMMARIZER_SYSTEM},
+            {"role": "user", "content": "\n\n".join(blocks)}
+        ],
+        max_tokens=max_tokens * len(blocks),
+        temperature=0.5
+    )
+    _record_usage(response.usage)
+    content = response.choices[0].message.content
+    for match in _BATCH_RE.finditer(content):
+        idx = int(match.group(1)) - 1
+        if 0 <= idx < len(texts) and summaries[idx] is None:
+            summaries[idx] = match.group(2).strip()
+
+    # Fall back to individual calls for anything the batch response missed.
+    missing = [i for i, summary in enumerate(summaries) if not summary]
+    if missing:
+        with ThreadPoolExecutor(max_workers=min(len(missing), MAX_WORKERS)) as ex:
+            fallback = ex.map(lambda i: summarize_article(texts[i], max_tokens), missing)
+            for i, summary in zip(missing, fallback):
+                summaries[i] = summary
+    return summaries
+
+
+def generate_report(articles, summaries, stream=False):
+    report_content = "".join(
+        f"### {i}. {art['title']}\n"
+        f"- **Summary:** {summary}\n"
+        f"- [Read full article]({art['url']})\n\n"
+        for i, (art, summary) in enumerate(zip(articles, summaries), 1)
+    )
 
     response = client.chat.completions.create(
         model=MODEL,
-        messages=[{"role": "user", "content": prompt}],
+        messages=[
+            {"role": "system", "content": REPORT_SYSTEM},
+            {"role": "user", "content": report_content}
+        ],
         max_tokens=400,
-        temperature=0.7
+        temperature=0.7,
+        stream=stream
     )
+    if stream:
+        return _stream_content(response)
+    _record_usage(response.usage)
     return response.choices[0].message.content.strip()
 
 
-def get_news_summary(query, num_articles=4, days_back=30):
-    articles = fetch_recent_articles(query, num_articles, days_back)
+def _stream_content(response):
+    for chunk in response:
+        # Groq reports usage for a streamed completion on its final chunk.
+        _record_usage(getattr(getattr(chunk, "x_groq", None), "usage", None))
+        if chunk.choices:
+            yield chunk.choices[0].delta.content or ""
+
+
+def _cache_when_done(key, chunks, articles, summaries):
+    # Store the streamed report once the caller has consumed all of it.
+    parts = []
+    for chunk in chunks:
+        parts.append(chunk)
+        yield chunk
+    cache.set(key, ("".join(parts).strip(), articles, summaries), expire=REPORT_CACHE_TTL)
+
+
+def get_article_summaries(query, num_articles=4, days_back=30, deep_extract=False):
+    # Syndicated copies of the same story would only cost extra downloads and tokens.
+    articles = dedupe_articles(fetch_recent_articles(query, num_articles, days_back))
     if not articles:
-        return "No recent articles found for this topic.", [], []
+        return [], []
+
+    full_texts = extract_full_texts(
+        [art['url'] for art in articles if needs_full_text(art, deep_extract)]
+    )
+    texts = [full_texts.get(art['url']) or art['description'] for art in articles]
+
+    summaries = summarize_articles_batch(texts)
+    return articles, summaries
 
-    summaries = []
-    for art in articles:
-        full_text = extract_full_text(art['url'])
-        summary = summarize_article(full_text)
-        summaries.append(summary)
+
+def get_news_summary(query, num_articles=4, days_back=30, force_refresh=False,
+                     deep_extract=False, stream=False):
+    """Return (report, articles, summaries).
+
+    With stream=True a freshly generated report is a generator of text chunks,
+    cached once it has been fully consumed; cached reports are always strings.
+    """
+    token_usage.clear()
+    key = hashlib.sha1(
+        f"{query.lower().strip()}|{num_articles}|{days_back}|{deep_extract}".encode()
+    ).hexdigest()
+    if force_refresh:
+        # Also drop memoized NewsAPI results, or a refresh re-summarizes stale articles.
+        fetch_recent_articles.clear()
+    else:
+        # A single get: the entry may expire between a membership test and a lookup.
+        hit = cache.get(key)
+        if hit is not None:
+            return hit
+
+    articles, summaries = get_article_summaries(query, num_articles, days_back, deep_extract)
+    if not articles:
+        return NO_ARTICLES_MESSAGE, [], []
+
+    if stream:
+        chunks = generate_report(articles, summaries, stream=True)
+        return _cache_when_done(key, chunks, articles, summaries), articles, summaries
 
     report = generate_report(articles, summaries)
+    cache.set(key, (report, articles, summaries), expire=REPORT_CACHE_TTL)
     return report, articles, summaries
 
 
@@ -181,6 +617,8 @@ st.markdown("---")
 # ---------------- User Input ----------------
 query = st.text_input("🔍 Enter a topic or keyword:", placeholder="e.g., recent advancements in renewable energy")
 num_articles = st.slider("Number of articles to fetch", 2, 10, 4)
+force_refresh = st.checkbox("Force refresh")
+deep_extract = st.sidebar.toggle("Deep extract (slower)", value=False)
 
 # ---------------- Action Button ----------------
 if st.button("🚀 Generate Report"):
@@ -188,34 +626,39 @@ if st.button("🚀 Generate Report"):
         st.warning("⚠️ Please enter a topic first.")
     else:
         with st.spinner("Fetching and processing articles..."):
-            report, articles, summaries = get_news_summary(query, num_articles=num_articles)
+            report, articles, summaries = get_news_summary(
+                query,
+                num_articles=num_articles,
+                force_refresh=force_refresh,
+                deep_extract=deep_extract,
+                stream=True
+            )
 
         # ---------------- Report Section ----------------
         st.markdown("### 📝 Summary Report")
-        st.markdown(
-            f"""
-            <div style="background-color:#f7f7f7; padding:20px; border-radius:12px; border:1px solid #e6e6e6;">
-            {report}
-            </div>
-            """,
-            unsafe_allow_html=True
-        )
+        with st.container(border=True):
+            if isinstance(report, str):
+                st.markdown(report)
+            else:
+                # Render tokens as they arrive.
+                st.write_stream(report)
+
+        if token_usage["prompt"]:
+            st.caption(f"Cache hit: {token_usage['cached']}/{token_usage['prompt']} prompt tokens")
 
         st.markdown("---")
 
         # ---------------- Individual Articles ----------------
         st.markdown("### 📑 Article Summaries")
 
-        for i, (art, summary) in enumerate(zip(articles, summaries), 1):
-            st.markdown(
-                f"""
-                <div class="article-card">
-                    <h4 style="margin-bottom: 10px;">{i}. {art['title']}</h4>
-                    <p style="margin-bottom: 12px; font-size: 15px; line-height: 1.6;">
-                        {summary}
-                    </p>
-                    <a href="{art['url']}" target="_blank" class="read-btn">Read More 👉</a>
-                </div>
-                """,
-                unsafe_allow_html=True
+        # Titles and summaries come from third parties, so escape them before rendering.
+        cards = "".join(
+            ARTICLE_CARD_TMPL.format(
+                i=i,
+                title=escape(art['title'] or ''),
+                summary=escape(summary),
+                url=escape(art['url'])
             )
+            for i, (art, summary) in enumerate(zip(articles, summaries), 1)
+        )
+        st.markdown(f"<div>{cards}</div>", unsafe_allow_html=True)